@@ -1,5 +1,7 @@
 # from __future__ import annotations
 
+from itertools import chain
+
 import compas_blender
 
 from compas_blender.artists._artist import BaseArtist
@@ -62,25 +64,25 @@ class MeshArtist(BaseArtist):
 
     @property
     def collection(self):
-        if not self._collection:
+        if self._collection is None:
             self._collection = compas_blender.create_collection('Mesh')
         return self._collection
 
     @property
     def vertexcollection(self):
-        if not self._vertexcollection:
+        if self._vertexcollection is None:
             self._vertexcollection = compas_blender.create_collections_from_path('Mesh::Vertices')[1]
         return self._vertexcollection
 
     @property
     def edgecollection(self):
-        if not self._edgecollection:
+        if self._edgecollection is None:
             self._edgecollection = compas_blender.create_collections_from_path('Mesh::Edges')[1]
         return self._edgecollection
 
     @property
     def facecollection(self):
-        if not self._facecollection:
+        if self._facecollection is None:
             self._facecollection = compas_blender.create_collections_from_path('Mesh::Faces')[1]
         return self._facecollection
 
@@ -118,14 +120,11 @@ class MeshArtist(BaseArtist):
     def clear(self):
         """Clear all objects previously drawn by this artist.
         """
-        objects = []
-        objects += list(self.object_vertex.keys())
-        objects += list(self.object_edge.keys())
-        objects += list(self.object_face.keys())
+        objects = list(chain(self.object_vertex, self.object_edge, self.object_face))
         compas_blender.delete_objects(objects)
-        self._object_vertex = {}
-        self._object_edge = {}
-        self._object_face = {}
+        self._object_vertex.clear()
+        self._object_edge.clear()
+        self._object_face.clear()
 
     # ==========================================================================
     # components
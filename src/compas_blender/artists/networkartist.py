@@ -1,9 +1,22 @@
 # from __future__ import annotations
 
+from itertools import chain
+
+import bpy
+
+from numpy import arange
+from numpy import asarray
+from numpy import bincount
+from numpy import float32
+from numpy import float64
+from numpy import split
+from numpy import unique
+
 import compas_blender
 
 from compas_blender.artists._artist import BaseArtist
 from compas.utilities import color_to_colordict as colordict
+from compas.utilities import hex_to_rgb
 
 
 __all__ = [
@@ -11,6 +24,33 @@ __all__ = [
 ]
 
 
+def _is_alive(block):
+    """Check if a Blender data block has not been removed.
+
+    Blocks can be removed outside the artist, for example by ``delete_all_objects``.
+    """
+    try:
+        block.name
+    except ReferenceError:
+        return False
+    return True
+
+
+def _color_groups(rgb):
+    """Group the rows of an array of colors by color.
+
+    Returns a list of color/row indices pairs.
+    """
+    rgb = asarray(rgb, dtype=float64).reshape((-1, 3))
+    colors, index = unique(rgb, axis=0, return_inverse=True)
+    index = index.ravel()
+    # sort the rows by color once
+    # and split them at the color boundaries
+    order = index.argsort(kind='stable')
+    bounds = bincount(index, minlength=len(colors)).cumsum()[:-1]
+    return [(tuple(color), rows) for color, rows in zip(colors.tolist(), split(order, bounds))]
+
+
 class NetworkArtist(BaseArtist):
     """Artist for COMPAS network objects.
 
@@ -27,6 +67,12 @@ class NetworkArtist(BaseArtist):
         The COMPAS network associated with the artist.
     settings : dict
         Default settings for color, scale, tolerance, ...
+    object_node : dict
+        Map between Blender objects and the nodes they represent.
+    object_edge : dict
+        Map between Blender objects and the edges they represent.
+    object_path : dict
+        Map between Blender objects and the paths they represent.
 
     """
 
@@ -35,9 +81,11 @@ class NetworkArtist(BaseArtist):
         self._nodecollection = None
         self._edgecollection = None
         self._pathcollection = None
-        self._object_node = {}
-        self._object_edge = {}
-        self._object_path = {}
+        self._node_template_mesh = None
+        self.object_node = {}
+        self.object_edge = {}
+        self.object_path = {}
+        self._node_table = None
         self.network = network
         self.settings = {
             'color.nodes': (255, 255, 255),
@@ -52,60 +100,56 @@ class NetworkArtist(BaseArtist):
 
     @property
     def nodecollection(self):
-        if not self._nodecollection:
+        if self._nodecollection is None:
             self._nodecollection = compas_blender.create_collections_from_path('Network::Nodes')[1]
         return self._nodecollection
 
     @property
     def edgecollection(self):
-        if not self._edgecollection:
+        if self._edgecollection is None:
             self._edgecollection = compas_blender.create_collections_from_path('Network::Edges')[1]
         return self._edgecollection
 
     @property
     def pathcollection(self):
-        if not self._pathcollection:
+        if self._pathcollection is None:
             self._pathcollection = compas_blender.create_collections_from_path('Network::Paths')[1]
         return self._pathcollection
 
     @property
-    def object_node(self):
-        if not self._object_node:
-            self._object_node = {}
-        return self._object_node
-
-    @object_node.setter
-    def object_node(self, values):
-        self._object_node = dict(values)
-
-    @property
-    def object_edge(self):
-        if not self._object_edge:
-            self._object_edge = {}
-        return self._object_edge
-
-    @object_edge.setter
-    def object_edge(self, values):
-        self._object_edge = dict(values)
-
-    @property
-    def object_path(self):
-        if not self._object_path:
-            self._object_path = {}
-        return self._object_path
-
-    @object_path.setter
-    def object_path(self, values):
-        self._object_path = dict(values)
+    def node_template_mesh(self):
+        """:class:`bpy.types.Mesh` - Unit icosphere shared by the node objects of all colors."""
+        if self._live_node_template_mesh() is None:
+            mesh = compas_blender.create_icosphere_mesh(f"{self.network.name}.nodes.sphere", radius=1.0)
+            # the fake user keeps the template when the node objects are deleted
+            mesh.use_fake_user = True
+            self._node_template_mesh = mesh
+        return self._node_template_mesh
+
+    def _live_node_template_mesh(self):
+        """Return the cached node template, or None if there is none or it was removed from Blender."""
+        mesh = self._node_template_mesh
+        if mesh is None:
+            return None
+        if not _is_alive(mesh):
+            self._node_template_mesh = None
+            return None
+        return mesh
 
     def clear(self):
-        objects = list(self.object_node.keys())
-        objects += list(self.object_edge.keys())
-        objects += list(self.object_path.keys())
+        objects = [obj for obj in chain(self.object_node, self.object_edge, self.object_path) if _is_alive(obj)]
         compas_blender.delete_objects(objects)
-        self._object_node = {}
-        self._object_edge = {}
-        self._object_path = {}
+        self.object_node.clear()
+        self.object_edge.clear()
+        self.object_path.clear()
+        template = self._live_node_template_mesh()
+        if template is not None:
+            # node objects drawn before the last call to draw_nodes may still use the template
+            # in that case it is removed with them
+            template.use_fake_user = False
+            if not template.users:
+                bpy.data.meshes.remove(template)
+            self._node_template_mesh = None
 
     def draw(self, settings=None):
         """Draw the network.
@@ -125,12 +169,38 @@ class NetworkArtist(BaseArtist):
         if not settings:
             settings = {}
         self.settings.update(settings)
-        if self.settings['show.nodes']:
-            self.draw_nodes()
-        if self.settings['show.edges']:
-            self.draw_edges()
+        show_nodes = self.settings['show.nodes']
+        show_edges = self.settings['show.edges']
+        if not (show_nodes or show_edges):
+            return self.objects
+        # nodes and edges share the node coordinates
+        # collect them only once per draw
+        node_coordinates = self.network.node_coordinates
+        nodes = list(self.network.nodes())
+        node_index = {node: index for index, node in enumerate(nodes)}
+        node_xyz = asarray([node_coordinates(node) for node in nodes], dtype=float32).reshape((-1, 3))
+        self._node_table = node_index, node_xyz
+        try:
+            if show_nodes:
+                self.draw_nodes()
+            if show_edges:
+                self.draw_edges()
+        finally:
+            self._node_table = None
         return self.objects
 
+    def _node_xyz(self, nodes):
+        """Return the coordinates of a selection of nodes as an array of shape (N, 3).
+
+        The array has the single precision layout of Blender vertex coordinates,
+        such that it can be passed to ``foreach_set`` without conversion.
+        """
+        if self._node_table is not None:
+            node_index, node_xyz = self._node_table
+            return node_xyz[[node_index[node] for node in nodes]]
+        node_coordinates = self.network.node_coordinates
+        return asarray([node_coordinates(node) for node in nodes], dtype=float32).reshape((-1, 3))
+
     def draw_nodes(self, nodes=None, color=None):
         """Draw a selection of nodes.
 
@@ -146,19 +216,52 @@ class NetworkArtist(BaseArtist):
         -------
         list of :class:`bpy.types.Object`
 
+        Notes
+        -----
+        Nodes with the same color are drawn as a single sphere instanced on the vertices of one mesh object.
+        If that would create more objects than nodes, every node is drawn as a separate sphere object instead.
+        In both cases the spheres share one mesh data block.
+
         """
-        nodes = nodes or list(self.network.nodes())
-        node_color = colordict(color, nodes, default=self.settings['color.nodes'], colorformat='rgb', normalize=False)
-        points = []
-        for node in nodes:
-            points.append({
-                'pos': self.network.node_coordinates(node),
-                'name': "{}.node.{}".format(self.network.name, node),
-                'color': node_color[node],
-                'radius': 0.05})
-
-        objects = compas_blender.draw_points(points, self.nodecollection)
-        self.object_node = zip(objects, nodes)
+        network = self.network
+        name = network.name
+        default_color = self.settings['color.nodes']
+        if isinstance(default_color, str):
+            # the color groups need rgb components
+            default_color = hex_to_rgb(default_color)
+        collection = self.nodecollection
+        nodes = nodes or list(network.nodes())
+        if color is None:
+            # all nodes have the default color
+            color_groups = [(default_color, arange(len(nodes)))]
+        else:
+            node_color = colordict(color, nodes, default=default_color, colorformat='rgb', normalize=False)
+            color_groups = _color_groups([node_color[node] for node in nodes])
+        xyz = self._node_xyz(nodes)
+        sphere = self.node_template_mesh
+        if 2 * len(color_groups) > len(nodes):
+            # a color group takes two objects
+            # with (nearly) one color per node a sphere per node takes fewer
+            node_rgb = [None] * len(nodes)
+            for rgb, rows in color_groups:
+                for row in rows:
+                    node_rgb[row] = rgb
+            points = [{
+                'pos': pos,
+                'name': f"{name}.node.{node}",
+                'color': rgb,
+                'radius': 0.05} for node, pos, rgb in zip(nodes, xyz.tolist(), node_rgb)]
+            objects = compas_blender.draw_points(points, collection, sphere=sphere)
+            self.object_node = {obj: [node] for obj, node in zip(objects, nodes)}
+            return objects
+        objects = []
+        groups = []
+        for rgb, rows in color_groups:
+            group = [nodes[row] for row in rows]
+            for obj in compas_blender.draw_points_bulk(xyz[rows], name=f"{name}.nodes", color=rgb, radius=0.05, collection=collection, sphere=sphere):
+                objects.append(obj)
+                groups.append(group)
+        self.object_node = dict(zip(objects, groups))
         return objects
 
     def draw_edges(self, edges=None, color=None):
@@ -176,20 +279,42 @@ class NetworkArtist(BaseArtist):
         -------
         list of :class:`bpy.types.Object`
 
+        Notes
+        -----
+        Edges with the same color are drawn as the splines of a single curve object.
+
         """
-        edges = edges or list(self.network.edges())
-        edge_color = colordict(color, edges, default=self.settings['color.edges'], colorformat='rgb', normalize=False)
-        lines = []
-        for edge in edges:
-            lines.append({
-                'start': self.network.node_coordinates(edge[0]),
-                'end': self.network.node_coordinates(edge[1]),
-                'color': edge_color[edge],
-                'name': "{}.edge.{}-{}".format(self.network.name, *edge),
-                'width': 0.02})
-
-        objects = compas_blender.draw_lines(lines, self.edgecollection)
-        self.object_edge = zip(objects, edges)
+        network = self.network
+        name = network.name
+        default_color = self.settings['color.edges']
+        if isinstance(default_color, str):
+            # the color groups need rgb components
+            default_color = hex_to_rgb(default_color)
+        collection = self.edgecollection
+        edges = edges or list(network.edges())
+        if color is None:
+            # all edges have the default color
+            color_groups = [(default_color, arange(len(edges)))]
+        else:
+            edge_color = colordict(color, edges, default=default_color, colorformat='rgb', normalize=False)
+            color_groups = _color_groups([edge_color[edge] for edge in edges])
+        objects = []
+        groups = []
+        for rgb, rows in color_groups:
+            group = [edges[row] for row in rows]
+            # edges share their end points
+            # look up the coordinates of every node only once
+            node_index = {}
+            for edge in group:
+                for node in edge:
+                    if node not in node_index:
+                        node_index[node] = len(node_index)
+            vertices = self._node_xyz(list(node_index)).tolist()
+            pairs = [(node_index[u], node_index[v]) for u, v in group]
+            obj = compas_blender.draw_lines_bulk(vertices, pairs, name=f"{name}.edges", color=rgb, width=0.02, collection=collection)
+            objects.append(obj)
+            groups.append(group)
+        self.object_edge = dict(zip(objects, groups))
         return objects
 
 
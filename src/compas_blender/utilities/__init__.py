@@ -36,9 +36,12 @@ drawing
 .. autosummary::
     :toctree: generated/
 
+    create_icosphere_mesh
     draw_points
     draw_pointcloud
+    draw_points_bulk
     draw_lines
+    draw_lines_bulk
     draw_cylinders
     draw_spheres
     draw_cubes
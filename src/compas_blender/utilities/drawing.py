@@ -1,7 +1,11 @@
 import bpy
+import bmesh
 
 from typing import Dict, List, Union, Tuple, Text
 
+from numpy import ascontiguousarray
+from numpy import float32
+
 from compas_blender.utilities import create_collection
 
 from compas.geometry import centroid_points
@@ -10,9 +14,12 @@ from compas.geometry import subtract_vectors
 
 
 __all__ = [
+    'create_icosphere_mesh',
     'draw_points',
     'draw_pointcloud',
+    'draw_points_bulk',
     'draw_lines',
+    'draw_lines_bulk',
     'draw_polylines',
     'draw_cylinders',
     'draw_spheres',
@@ -61,10 +68,39 @@ def _create_material(rgb, alpha=1.0):
     return material
 
 
-def _set_object_color(obj, rgb, alpha=1.0):
+def _create_uvsphere_mesh(name, radius=1.0, segments=10):
+    bm = bmesh.new()
+    bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=segments, diameter=radius)
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def create_icosphere_mesh(name: str,
+                          radius: float = 1.0,
+                          subdivisions: int = 1) -> bpy.types.Mesh:
+    """Create an icosphere mesh data block, without an object."""
+    bm = bmesh.new()
+    bmesh.ops.create_icosphere(bm, subdivisions=subdivisions, diameter=radius)
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def _set_object_color(obj, rgb, alpha=1.0, link='DATA'):
     rgba = list(rgb) + [alpha]
     material = _create_material(rgb, alpha)
     obj.color = rgba
+    if link == 'OBJECT':
+        # the data block is shared between objects
+        # link the material to the object to leave the data untouched
+        if not obj.data.materials:
+            obj.data.materials.append(None)
+        obj.material_slots[0].link = 'OBJECT'
+        obj.material_slots[0].material = material
+        return
     if obj.data.materials:
         obj.data.materials[0] = material
     else:
@@ -106,23 +142,33 @@ def draw_texts(texts: List[Dict],
 # https://docs.blender.org/api/current/gpu.html#custom-shader-for-dotted-3d-line
 # https://docs.blender.org/api/current/gpu.html#triangle-with-custom-shader
 def draw_points(points: List[Dict],
-                collection: Union[Text, bpy.types.Collection] = None) -> List[bpy.types.Object]:
-    """Draw point objects."""
+                collection: Union[Text, bpy.types.Collection] = None,
+                sphere: bpy.types.Mesh = None) -> List[bpy.types.Object]:
+    """Draw point objects.
+
+    The point objects share a single sphere mesh.
+    A sphere mesh with unit radius can be provided to share it with other objects.
+    """
     P = len(points)
     N = len(str(P))
-    add_point = bpy.ops.mesh.primitive_uv_sphere_add
+    # create the objects with the data api instead of bpy.ops
+    # to avoid a context and undo stack update per point
+    if sphere is None:
+        sphere = _create_uvsphere_mesh('P', radius=1.0, segments=10)
     objects = [0] * P
     for index, point in enumerate(points):
         xyz = point['pos']
         radius = point.get('radius', 1.0)
         name = point.get('name', f'P.{index:0{N}d}')
         color = list(point.get('color', [1.0, 1.0, 1.0]))
-        add_point(location=xyz, radius=radius, segments=10, ring_count=10)
-        obj = bpy.context.object
-        obj.name = name
+        # all points share the sphere mesh
+        # the material is linked to the object
+        obj = bpy.data.objects.new(name, sphere)
+        obj.location = xyz
+        obj.scale = (radius, radius, radius)
         # values = [True] * len(obj.data.polygons)
         # obj.data.polygons.foreach_set("use_smooth", values)
-        _set_object_color(obj, color)
+        _set_object_color(obj, color, link='OBJECT')
         objects[index] = obj
     _link_objects(objects, collection)
     return objects
@@ -153,6 +199,46 @@ def draw_pointcloud(points: List[Dict],
     return objects
 
 
+def draw_points_bulk(xyz,
+                     name: str = 'points',
+                     color: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+                     radius: float = 1.0,
+                     collection: Union[Text, bpy.types.Collection] = None,
+                     sphere: bpy.types.Mesh = None) -> List[bpy.types.Object]:
+    """Draw points as spheres instanced on the vertices of a single mesh object.
+
+    The coordinates are provided as an array of shape ``(N, 3)``,
+    and written to the mesh in one call to ``foreach_set``.
+    A single sphere object is parented to the mesh and duplicated on its vertices,
+    such that only two objects are created regardless of the number of points.
+    The function returns both.
+
+    A sphere mesh with unit radius can be provided to share one data block
+    between multiple calls. The sphere object is then scaled to the radius,
+    and its material is linked to the object instead of the shared data.
+    """
+    # vertex coordinates are stored in single precision
+    # a contiguous float32 array is passed to foreach_set without a copy
+    xyz = ascontiguousarray(xyz, dtype=float32).reshape((-1, 3))
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(xyz))
+    mesh.vertices.foreach_set('co', xyz.ravel())
+    mesh.update()
+    obj = bpy.data.objects.new(name, mesh)
+    obj.instance_type = 'VERTS'
+    if sphere is None:
+        sphere = bpy.data.objects.new(f'{name}.sphere', create_icosphere_mesh(f'{name}.sphere', radius=radius))
+        _set_object_color(sphere, color)
+    else:
+        sphere = bpy.data.objects.new(f'{name}.sphere', sphere)
+        sphere.scale = (radius, radius, radius)
+        _set_object_color(sphere, color, link='OBJECT')
+    sphere.parent = obj
+    _set_object_color(obj, color)
+    _link_objects([obj, sphere], collection)
+    return [obj, sphere]
+
+
 # replace this by a custom line shader
 # https://docs.blender.org/api/current/gpu.html#custom-shader-for-dotted-3d-line
 # https://docs.blender.org/api/current/gpu.html#triangle-with-custom-shader
@@ -188,6 +274,35 @@ def draw_lines(lines: List[Dict],
     return objects
 
 
+def draw_lines_bulk(vertices: List[List[float]],
+                    edges: List[Tuple[int, int]],
+                    name: str = 'lines',
+                    color: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+                    width: float = 0.05,
+                    collection: Union[Text, bpy.types.Collection] = None) -> bpy.types.Object:
+    """Draw lines as the splines of a single curve object.
+
+    The lines are defined by pairs of indices into the list of vertices.
+    Every line is a poly spline of the same curve data block,
+    with a bevel of the given width, such that the lines are also rendered.
+    """
+    curve = bpy.data.curves.new(name, type='CURVE')
+    curve.dimensions = '3D'
+    curve.fill_mode = 'FULL'
+    curve.bevel_depth = width
+    curve.bevel_resolution = 0
+    curve.resolution_u = 20
+    for u, v in edges:
+        spline = curve.splines.new('POLY')
+        spline.points.add(1)
+        spline.points.foreach_set('co', list(vertices[u]) + [1.0] + list(vertices[v]) + [1.0])
+        spline.order_u = 1
+    obj = bpy.data.objects.new(name, curve)
+    _set_object_color(obj, color)
+    _link_objects([obj], collection)
+    return obj
+
+
 # replace this by a custom polyline shader
 # https://docs.blender.org/api/current/gpu.html#custom-shader-for-dotted-3d-line
 # https://docs.blender.org/api/current/gpu.html#triangle-with-custom-shader
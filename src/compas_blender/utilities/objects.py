@@ -1,4 +1,5 @@
 import bpy
+from collections import Counter
 from typing import List, Iterable, Text
 
 # from compas.datastructures import Mesh
@@ -54,16 +55,9 @@ __all__ = [
 
 def delete_all_objects():
     """Delete all mesh and curve scene objects, and the attached mesh and curve data blocks."""
-    for obj in bpy.data.objects:
-        # if obj.type == 'MESH':
-        #     bpy.data.objects.remove(obj)
-        # elif obj.type == 'CURVE':
-        #     bpy.data.objects.remove(obj)
-        bpy.data.objects.remove(obj)
-    for mesh in bpy.data.meshes:
-        bpy.data.meshes.remove(mesh)
-    for curve in bpy.data.curves:
-        bpy.data.curves.remove(curve)
+    bpy.data.batch_remove(ids=list(bpy.data.objects))
+    bpy.data.batch_remove(ids=list(bpy.data.meshes))
+    bpy.data.batch_remove(ids=list(bpy.data.curves))
 
 
 def delete_object(obj: bpy.types.Object):
@@ -72,24 +66,22 @@ def delete_object(obj: bpy.types.Object):
     If the scene object is of type "MESH" or "CURVE",
     the attached data blocks are also removed.
     """
-    if obj.type == 'MESH':
-        mesh = obj.data
-        bpy.data.objects.remove(obj)
-        if mesh:
-            bpy.data.meshes.remove(mesh)
-    elif obj.type == 'CURVE':
-        curve = obj.data
-        bpy.data.objects.remove(obj)
-        if curve:
-            bpy.data.curves.remove(curve)
-    else:
-        bpy.data.objects.remove(obj)
+    delete_objects([obj])
 
 
 def delete_objects(objects: Iterable[bpy.types.Object]):
-    """Delete multiple scene objects."""
-    for obj in objects:
-        delete_object(obj)
+    """Delete multiple scene objects.
+
+    The data blocks attached to scene objects of type "MESH" or "CURVE" are also removed,
+    unless they are still used by objects that are not deleted.
+    Objects and data blocks are removed in a single batch.
+    """
+    objects = list(objects)
+    # data blocks can be shared between objects
+    # count the deleted objects that use them
+    data_count = Counter(obj.data for obj in objects if obj.type in ('MESH', 'CURVE') and obj.data)
+    data = [block for block, count in data_count.items() if block.users <= count]
+    bpy.data.batch_remove(ids=objects + data)
 
 
 def delete_object_by_name(name: str):
@@ -99,9 +91,15 @@ def delete_object_by_name(name: str):
 
 
 def delete_objects_by_names(names: Iterable[Text]):
-    """Delete the scene objects corresponding to the list of names."""
-    objects = get_objects_by_names(names)
-    delete_objects(objects)
+    """Delete the scene objects corresponding to the list of names.
+
+    Names that do not correspond to a scene object are ignored.
+    """
+    # lookups by name in a bpy_prop_collection are not guaranteed to be constant time
+    # build a map from name to object once
+    name_object = {obj.name: obj for obj in bpy.data.objects}
+    objects = (name_object.get(name) for name in set(names))
+    delete_objects(obj for obj in objects if obj is not None)
 
 
 # ==============================================================================
@@ -116,7 +114,10 @@ def get_object_by_name(name: str) -> bpy.types.Object:
 
 def get_objects_by_names(names: Iterable[str]) -> List[bpy.types.Object]:
     """Get the objects corresponding to the given names."""
-    return [bpy.data.objects[name] for name in names]
+    # lookups by name in a bpy_prop_collection are not guaranteed to be constant time
+    # build a map from name to object once
+    name_object = {obj.name: obj for obj in bpy.data.objects}
+    return [name_object[name] for name in names]
 
 
 # def get_objects(names=None, color=None, layer=None, type=None):
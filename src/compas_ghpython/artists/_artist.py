@@ -14,6 +14,8 @@ class BaseArtist(ABC):
     """Abstract base class for all GH artists.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -36,13 +36,16 @@ class FrameArtist(PrimitiveArtist):
 
     """
 
+    # the default colors are immutable
+    # and can be shared by all instances
+    color_origin = (0, 0, 0)
+    color_xaxis = (255, 0, 0)
+    color_yaxis = (0, 255, 0)
+    color_zaxis = (0, 0, 255)
+
     def __init__(self, frame, layer=None, name=None, scale=1.0):
         super(FrameArtist, self).__init__(frame, layer=layer, name=name)
         self.scale = scale
-        self.color_origin = (0, 0, 0)
-        self.color_xaxis = (255, 0, 0)
-        self.color_yaxis = (0, 255, 0)
-        self.color_zaxis = (0, 0, 255)
 
     def draw(self):
         """Draw the frame.
@@ -55,12 +58,7 @@ class FrameArtist(PrimitiveArtist):
             * geometry[1] : list of :class:`Rhino.Geometry.Line`
 
         """
-        points = []
-        lines = []
-        origin = list(self.primitive.point)
-        x = list(self.primitive.point + self.primitive.xaxis.scaled(self.scale))
-        y = list(self.primitive.point + self.primitive.yaxis.scaled(self.scale))
-        z = list(self.primitive.point + self.primitive.zaxis.scaled(self.scale))
+        origin, x, y, z = _frame_axes(self.primitive, self.scale)
         points = [{'pos': origin, 'color': self.color_origin}]
         lines = [
             {'start': origin, 'end': x, 'color': self.color_xaxis, 'arrow': 'end'},
@@ -71,6 +69,52 @@ class FrameArtist(PrimitiveArtist):
         geometry[1] = compas_ghpython.draw_lines(lines)
         return geometry
 
+    @staticmethod
+    def draw_collection(collection, scale=1.0):
+        """Draw a collection of frames.
+
+        Parameters
+        ----------
+        collection : list of compas.geometry.Frame
+            A collection of ``Frame`` objects.
+        scale : float, optional
+            The scale of the vectors representing the axes of the frames.
+            Default is ``1.0``.
+
+        Returns
+        -------
+        geometry : list
+
+            * geometry[0] : list of :class:`Rhino.Geometry.Point`
+            * geometry[1] : list of :class:`Rhino.Geometry.Line`
+
+        """
+        points = []
+        lines = []
+        for frame in collection:
+            origin, x, y, z = _frame_axes(frame, scale)
+            points.append({'pos': origin})
+            lines.append({'start': origin, 'end': x})
+            lines.append({'start': origin, 'end': y})
+            lines.append({'start': origin, 'end': z})
+        geometry = [None, None]
+        geometry[0] = compas_ghpython.draw_points(points)
+        geometry[1] = compas_ghpython.draw_lines(lines)
+        return geometry
+
+
+def _frame_axes(frame, scale):
+    """Return the origin of a frame and the end points of its scaled axes."""
+    ox, oy, oz = frame.point
+    ax, ay, az = frame.xaxis
+    bx, by, bz = frame.yaxis
+    cx, cy, cz = frame.zaxis
+    origin = [ox, oy, oz]
+    x = [ox + ax * scale, oy + ay * scale, oz + az * scale]
+    y = [ox + bx * scale, oy + by * scale, oz + bz * scale]
+    z = [ox + cx * scale, oy + cy * scale, oz + cz * scale]
+    return origin, x, y, z
+
 
 # ==============================================================================
 # Main
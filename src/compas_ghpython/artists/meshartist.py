@@ -2,11 +2,13 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import Rhino
+from itertools import chain
 
 import compas_ghpython
 from compas_ghpython.artists._artist import BaseArtist
+from compas.geometry import centroid_polygon
 from compas.utilities import color_to_colordict
+from compas.utilities import pairwise
 
 
 __all__ = ['MeshArtist']
@@ -46,8 +48,12 @@ class MeshArtist(BaseArtist):
 
     """
 
+    __slots__ = ('_mesh', '_vertex_table', '_edge_table', 'settings')
+
     def __init__(self, mesh):
         self._mesh = None
+        self._vertex_table = None
+        self._edge_table = None
         self.mesh = mesh
         self.settings = {
             'color.vertices': (255, 255, 255),
@@ -86,24 +92,63 @@ class MeshArtist(BaseArtist):
             * geometry[5]: list of :class:`Rhino.Geometry.TextDot` or `None`, if `self.settings['show.edgelabels']` is False.
 
         """
-        geometry = [None, None, None, None, None, None]
+        geometry = [None] * 6
+
+        settings = self.settings
+        show_vertices = settings['show.vertices']
+        show_faces = settings['show.faces']
+        show_edges = settings['show.edges']
+        if not (show_vertices or show_faces or show_edges):
+            return geometry
+
+        # all components are drawn from the same vertex coordinates
+        # and edges and edge labels from the same edges
+        # collect them only once per draw
+        self._vertex_table = self._vertex_xyz()
+        if show_edges:
+            self._edge_table = self._edges()
+        try:
+            if show_vertices:
+                geometry[0] = self.draw_vertices()
+                if settings['show.vertexlabels']:
+                    geometry[1] = self.draw_vertexlabels()
+
+            if show_faces:
+                geometry[2] = self.draw_faces(join_faces=settings['join_faces'])
+                if settings['show.facelabels']:
+                    geometry[3] = self.draw_facelabels()
+
+            if show_edges:
+                geometry[4] = self.draw_edges()
+                if settings['show.edgelabels']:
+                    geometry[5] = self.draw_edgelabels()
+        finally:
+            self._vertex_table = None
+            self._edge_table = None
 
-        if self.settings['show.vertices']:
-            geometry[0] = self.draw_nodes()
-            if self.settings['show.vertexlabels']:
-                geometry[1] = self.draw_nodelabels()
+        return geometry
 
-        if self.settings['show.faces']:
-            geometry[2] = self.draw_faces(join_faces=self.settings['join_faces'])
-            if self.settings['show.facelabels']:
-                geometry[3] = self.draw_facelabels()
+    def _vertex_xyz(self, vertices=None):
+        """Return a map from vertex keys to vertex coordinates.
 
-        if self.settings['show.edges']:
-            geometry[4] = self.draw_edges()
-            if self.settings['show.edgelabels']:
-                geometry[5] = self.draw_edgelabels()
+        During :meth:`draw`, the map is computed once for all vertices and shared by all components.
+        Otherwise, only the given vertices are included, or all vertices if none are given.
+        """
+        if self._vertex_table is not None:
+            return self._vertex_table
+        vertex = self.mesh.vertex
+        if vertices is None:
+            return {key: [attr['x'], attr['y'], attr['z']] for key, attr in vertex.items()}
+        return {key: [vertex[key]['x'], vertex[key]['y'], vertex[key]['z']] for key in vertices}
 
-        return geometry
+    def _edges(self):
+        """Return the list of edges of the mesh.
+
+        During :meth:`draw`, the list is computed once and shared by all components.
+        """
+        if self._edge_table is not None:
+            return self._edge_table
+        return list(self.mesh.edges())
 
     # ==============================================================================
     # components
@@ -167,18 +212,24 @@ class MeshArtist(BaseArtist):
         list of :class:`Rhino.Geometry.Point3d`
 
         """
-        vertices = keys or list(self.mesh.vertices())
-        colordict = color_to_colordict(color,
-                                       vertices,
-                                       default=self.settings['color.vertices'],
-                                       colorformat='rgb',
-                                       normalize=False)
+        default_color = self.settings['color.vertices']
+        if color is None:
+            # all vertices have the default color
+            colordict = None
+        else:
+            colordict = color_to_colordict(color,
+                                           keys or self.mesh.vertices(),
+                                           default=default_color,
+                                           colorformat='rgb',
+                                           normalize=False)
+        vertex_xyz = self._vertex_xyz(keys or None)
+        mesh_name = self.mesh.name
         points = []
-        for vertex in vertices:
+        for vertex in keys or self.mesh.vertices():
             points.append({
-                'pos': self.mesh.vertex_coordinates(vertex),
-                'name': "{}.vertex.{}".format(self.mesh.name, vertex),
-                'color': colordict[vertex]
+                'pos': vertex_xyz[vertex],
+                'name': "%s.vertex.%s" % (mesh_name, vertex),
+                'color': default_color if colordict is None else colordict[vertex]
             })
         return compas_ghpython.draw_points(points)
 
@@ -197,35 +248,76 @@ class MeshArtist(BaseArtist):
             Individual colors can be assigned using a dictionary of key-color pairs.
             Missing keys will be assigned the default face color (``self.settings['color.faces']``).
             The default is ``None``, in which case all faces are assigned the default face color.
+        join_faces : bool, optional
+            Join the faces into a single mesh.
+            Default is ``False``.
 
         Returns
         -------
         list of :class:`Rhino.Geometry.Mesh`
 
-        """
-        keys = keys or list(self.mesh.faces())
-
-        colordict = color_to_colordict(color,
-                                       keys,
-                                       default=self.settings['color.faces'],
-                                       colorformat='rgb',
-                                       normalize=False)
-        faces = []
-        for fkey in keys:
-            faces.append({
-                'points': self.mesh.face_coordinates(fkey),
-                'name': "{}.face.{}".format(self.mesh.name, fkey),
-                'color': colordict[fkey]
-            })
+        Notes
+        -----
+        If the faces are joined, faces with more than 4 vertices are triangulated on-the-fly.
 
-        meshes = compas_ghpython.draw_faces(faces)
-        if not join_faces:
-            return meshes
-
-        joined_mesh = Rhino.Geometry.Mesh()
-        for mesh in meshes:
-            joined_mesh.Append(mesh)
-        return [joined_mesh]
+        """
+        face_vertices = self.mesh.face_vertices
+        vertex_xyz = self._vertex_xyz(chain.from_iterable(map(face_vertices, keys)) if keys else None)
+
+        if join_faces:
+            if not keys:
+                mesh_faces = list(self.mesh.face.values())
+                ngons = any(len(face) < 3 or len(face) > 4 for face in mesh_faces)
+                if not ngons and len(set(chain.from_iterable(mesh_faces))) == len(vertex_xyz):
+                    # without ngons the faces need no triangulation
+                    # and without isolated vertices the vertices of the mesh can be used as they are
+                    key_index = {key: index for index, key in enumerate(vertex_xyz)}
+                    faces = [[key_index[key] for key in face] for face in mesh_faces]
+                    return [compas_ghpython.draw_mesh(list(vertex_xyz.values()), faces)]
+
+            # build the joined mesh directly from the shared vertices
+            # instead of appending one mesh per face
+            vertex_index = {}
+            vertices = []
+            faces = []
+            for fkey in keys or self.mesh.faces():
+                face = []
+                for vertex in face_vertices(fkey):
+                    if vertex not in vertex_index:
+                        vertex_index[vertex] = len(vertices)
+                        vertices.append(vertex_xyz[vertex])
+                    face.append(vertex_index[vertex])
+                f = len(face)
+                if f == 3:
+                    faces.append(face + face[-1:])
+                elif f == 4:
+                    faces.append(face)
+                elif f > 4:
+                    centroid = len(vertices)
+                    vertices.append(centroid_polygon([vertices[index] for index in face]))
+                    for a, b in pairwise(face + face[0:1]):
+                        faces.append([centroid, a, b, b])
+            return [compas_ghpython.draw_mesh(vertices, faces)]
+
+        default_color = self.settings['color.faces']
+        if color is None:
+            # all faces have the default color
+            colordict = None
+        else:
+            colordict = color_to_colordict(color,
+                                           keys or self.mesh.faces(),
+                                           default=default_color,
+                                           colorformat='rgb',
+                                           normalize=False)
+        mesh_name = self.mesh.name
+        # the face definitions are generated while the meshes are drawn
+        # without collecting them in a list first
+        faces = ({
+            'points': [vertex_xyz[vertex] for vertex in face_vertices(fkey)],
+            'name': "%s.face.%s" % (mesh_name, fkey),
+            'color': default_color if colordict is None else colordict[fkey]
+        } for fkey in keys or self.mesh.faces())
+        return compas_ghpython.draw_faces(faces)
 
     def draw_edges(self, keys=None, color=None):
         """Draw a selection of edges.
@@ -248,20 +340,26 @@ class MeshArtist(BaseArtist):
         list of :class:`Rhino.Geometry.Line`
 
         """
-        edges = keys or list(self.mesh.edges())
-        colordict = color_to_colordict(color,
-                                       edges,
-                                       default=self.settings['color.edges'],
-                                       colorformat='rgb',
-                                       normalize=False)
+        edges = keys or self._edges()
+        default_color = self.settings['color.edges']
+        if color is None:
+            # all edges have the default color
+            colordict = None
+        else:
+            colordict = color_to_colordict(color,
+                                           edges,
+                                           default=default_color,
+                                           colorformat='rgb',
+                                           normalize=False)
+        vertex_xyz = self._vertex_xyz(chain.from_iterable(keys) if keys else None)
+        mesh_name = self.mesh.name
         lines = []
-        for edge in edges:
-            start, end = self.mesh.edge_coordinates(*edge)
+        for u, v in edges:
             lines.append({
-                'start': start,
-                'end': end,
-                'color': colordict[edge],
-                'name': "{}.edge.{}-{}".format(self.mesh.name, *edge)
+                'start': vertex_xyz[u],
+                'end': vertex_xyz[v],
+                'color': default_color if colordict is None else colordict[(u, v)],
+                'name': "%s.edge.%s-%s" % (mesh_name, u, v)
             })
         return compas_ghpython.draw_lines(lines)
 
@@ -298,19 +396,26 @@ class MeshArtist(BaseArtist):
         else:
             raise NotImplementedError
 
-        colordict = color_to_colordict(color,
-                                       textdict.keys(),
-                                       default=self.settings['color.vertices'],
-                                       colorformat='rgb',
-                                       normalize=False)
+        default_color = self.settings['color.vertices']
+        if color is None:
+            # all labels have the default color
+            colordict = None
+        else:
+            colordict = color_to_colordict(color,
+                                           textdict.keys(),
+                                           default=default_color,
+                                           colorformat='rgb',
+                                           normalize=False)
+        vertex_xyz = self._vertex_xyz(None if text is None else textdict)
+        mesh_name = self.mesh.name
         labels = []
 
-        for key, text in iter(textdict.items()):
+        for key, text in textdict.items():
             labels.append({
-                'pos': self.mesh.vertex_coordinates(key),
-                'name': "{}.vertexlabel.{}".format(self.mesh.name, key),
-                'color': colordict[key],
-                'text': textdict[key]
+                'pos': vertex_xyz[key],
+                'name': "%s.vertexlabel.%s" % (mesh_name, key),
+                'color': default_color if colordict is None else colordict[key],
+                'text': text
             })
 
         return compas_ghpython.draw_labels(labels)
@@ -345,19 +450,27 @@ class MeshArtist(BaseArtist):
         else:
             raise NotImplementedError
 
-        colordict = color_to_colordict(color,
-                                       textdict.keys(),
-                                       default=self.settings['color.faces'],
-                                       colorformat='rgb',
-                                       normalize=False)
-
+        default_color = self.settings['color.faces']
+        if color is None:
+            # all labels have the default color
+            colordict = None
+        else:
+            colordict = color_to_colordict(color,
+                                           textdict.keys(),
+                                           default=default_color,
+                                           colorformat='rgb',
+                                           normalize=False)
+
+        face_vertices = self.mesh.face_vertices
+        vertex_xyz = self._vertex_xyz(None if text is None else chain.from_iterable(map(face_vertices, textdict)))
+        mesh_name = self.mesh.name
         labels = []
-        for key, text in iter(textdict.items()):
+        for key, text in textdict.items():
             labels.append({
-                'pos': self.mesh.face_center(key),
-                'name': "{}.facelabel.{}".format(self.mesh.name, key),
-                'color': colordict[key],
-                'text': textdict[key]
+                'pos': centroid_polygon([vertex_xyz[vertex] for vertex in face_vertices(key)]),
+                'name': "%s.facelabel.%s" % (mesh_name, key),
+                'color': default_color if colordict is None else colordict[key],
+                'text': text
             })
         return compas_ghpython.draw_labels(labels)
 
@@ -385,25 +498,34 @@ class MeshArtist(BaseArtist):
 
         """
         if text is None:
-            textdict = {(u, v): "{}-{}".format(u, v) for u, v in self.mesh.edges()}
+            textdict = {(u, v): "%s-%s" % (u, v) for u, v in self._edges()}
         elif isinstance(text, dict):
             textdict = text
         else:
             raise NotImplementedError
 
-        colordict = color_to_colordict(color,
-                                       textdict.keys(),
-                                       default=self.settings['color.edges'],
-                                       colorformat='rgb',
-                                       normalize=False)
+        default_color = self.settings['color.edges']
+        if color is None:
+            # all labels have the default color
+            colordict = None
+        else:
+            colordict = color_to_colordict(color,
+                                           textdict.keys(),
+                                           default=default_color,
+                                           colorformat='rgb',
+                                           normalize=False)
+        vertex_xyz = self._vertex_xyz(None if text is None else chain.from_iterable(textdict))
+        mesh_name = self.mesh.name
         labels = []
 
-        for (u, v), text in iter(textdict.items()):
+        for (u, v), text in textdict.items():
+            a = vertex_xyz[u]
+            b = vertex_xyz[v]
             labels.append({
-                'pos': self.mesh.edge_midpoint(u, v),
-                'name': "{}.edgelabel.{}-{}".format(self.mesh.name, u, v),
-                'color': colordict[(u, v)],
-                'text': textdict[(u, v)]
+                'pos': [0.5 * (a[0] + b[0]), 0.5 * (a[1] + b[1]), 0.5 * (a[2] + b[2])],
+                'name': "%s.edgelabel.%s-%s" % (mesh_name, u, v),
+                'color': default_color if colordict is None else colordict[(u, v)],
+                'text': text
             })
 
         return compas_ghpython.draw_labels(labels)
@@ -375,8 +375,13 @@ def draw_mesh(vertices, faces, color=None, vertex_normals=None, texture_coordina
 
     """
     mesh = Mesh()
-    for a, b, c in vertices:
-        mesh.Vertices.Add(a, b, c)
+    # add the vertices in one call from an array
+    # instead of converting and adding them one by one
+    count = len(vertices)
+    points = CreateInstance(Point3d, count)
+    for i, (a, b, c) in enumerate(vertices):
+        points[i] = Point3d(a, b, c)
+    mesh.Vertices.AddVertices(points)
     for face in faces:
         if len(face) < 4:
             mesh.Faces.AddFace(face[0], face[1], face[2])
@@ -400,8 +405,9 @@ def draw_mesh(vertices, faces, color=None, vertex_normals=None, texture_coordina
     if color:
         count = len(vertices)
         colors = CreateInstance(Color, count)
+        color = rs.coercecolor(color)
         for i in range(count):
-            colors[i] = rs.coercecolor(color)
+            colors[i] = color
         mesh.VertexColors.SetColors(colors)
 
     return mesh